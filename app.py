@@ -1,15 +1,19 @@
 from flask import Flask, jsonify, request
-from datetime import datetime
-from azure.data.tables import TableServiceClient
+from cachetools import TTLCache
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from azure.data.tables import TableServiceClient, TableTransactionError
 from azure.core.exceptions import ResourceExistsError, ResourceNotFoundError
+from azure.core.pipeline.transport import RequestsTransport
 import os
 import logging
-import json
+import orjson
+import socket
 import time
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
-from dateutil.parser import parse
-import traceback
+from urllib3.util.retry import Retry
 from azure_key_vault import AzureKeyVaultClient
 from werkzeug.middleware.proxy_fix import ProxyFix
 
@@ -33,10 +37,19 @@ logger = logging.getLogger(__name__)
 REQUEST_TIMEOUT = int(os.environ.get('REQUEST_TIMEOUT', 30))
 MAX_RETRIES = int(os.environ.get('MAX_RETRIES', 3))
 RETRY_DELAY = int(os.environ.get('RETRY_DELAY', 1))
+# Jira ticket creation fan-out; must stay <= the session pool_maxsize
+JIRA_WORKERS = int(os.environ.get('JIRA_WORKERS', 8))
 
 def load_secrets():
     """Load secrets from environment variables first, then from Azure Key Vault if needed"""
     try:
+        # If every required secret is already in the environment there is
+        # nothing to fetch - skip building a vault client entirely
+        required_env = [name.replace("-", "_") for name in AzureKeyVaultClient.REQUIRED_SECRETS]
+        if all(os.environ.get(name) for name in required_env):
+            logger.info("All required secrets found in environment, skipping Key Vault")
+            return
+
         vault_name = os.environ.get('AZURE_VAULT_NAME')
         if not vault_name:
             raise ValueError("AZURE_VAULT_NAME environment variable is not set")
@@ -74,42 +87,200 @@ if not all([JIRA_TOKEN, JIRA_EMAIL, JIRA_URL, JIRA_PROJECT,
            AZURE_CONNECTION_STRING, APPINSIGHTS_APP_ID, APPINSIGHTS_API_KEY]):
     raise ValueError("Missing required environment variables")
 
+class TCPTuningAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that disables Nagle's algorithm and enables TCP keep-alive
+    on pooled sockets. Table Storage writes are tiny payloads, and Nagle
+    interacting with delayed ACKs stalls each one by up to ~200ms.
+    """
+
+    _SOCKET_OPTIONS = [
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] = self._SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+def _build_table_transport():
+    """Build the tuned transport handed to the Table SDK pipeline"""
+    session = requests.Session()
+    adapter = TCPTuningAdapter(pool_connections=20, pool_maxsize=20)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    # Suppress Expect: 100-continue so small writes don't wait a round-trip
+    # for the server's interim response
+    session.headers.update({'Expect': ''})
+    return RequestsTransport(session=session, session_owner=False)
+
+def _build_session(auth=None):
+    """Create a requests.Session with connection pooling and retry support"""
+    session = requests.Session()
+    session.auth = auth
+    adapter = HTTPAdapter(
+        pool_connections=20,
+        pool_maxsize=20,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=[429, 502, 503, 504]
+        )
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+# Shared sessions so repeated Jira/App Insights calls reuse keep-alive
+# connections instead of paying a TCP+TLS handshake per request
+JIRA_SESSION = _build_session(auth=HTTPBasicAuth(JIRA_EMAIL, JIRA_TOKEN))
+APPINSIGHTS_SESSION = _build_session()
+
+# App Insights query configuration - the query, endpoint and headers never
+# change between calls, so build them once
+APPINSIGHTS_QUERY = """
+exceptions
+| where timestamp >= ago(1h)
+| project
+    timestamp,              // When the exception occurred
+    problemId,             // Unique identifier for the exception
+    type,                  // Exception type (e.g., NullReferenceException)
+    outerMessage,          // The exception message
+    customDimensions       // Additional context (environment, version, etc.)
+| order by timestamp desc  // Most recent first
+"""
+APPINSIGHTS_URL = f"https://api.applicationinsights.io/v1/apps/{APPINSIGHTS_APP_ID}/query"
+APPINSIGHTS_HEADERS = {
+    "X-Api-Key": APPINSIGHTS_API_KEY,
+    "Content-Type": "application/json"
+}
+
+# Jira ticket description, formatted once per row with .format() instead of
+# rebuilding a multi-line f-string inside the trigger loop
+_DESC_TMPL = """Exception Details:
+-----------------
+Problem ID: {problem_id}
+Timestamp: {timestamp}
+Type: {type}
+
+Message:
+{message}
+
+Custom Dimensions:
+{custom_dimensions}
+
+*Created by automatic exception tracking*"""
+
+def fast_parse(timestamp):
+    """
+    Parse an App Insights ISO-8601 timestamp. The format is fixed
+    (always UTC with a trailing Z), so datetime.fromisoformat is enough
+    and ~20x faster than dateutil's general-purpose parser.
+    """
+    return datetime.fromisoformat(timestamp.rstrip('Z').split('.')[0])
+
+def make_row_key(parsed_time):
+    """
+    Build the fixed-format YYYYMMDDHHMMSS RowKey straight from the
+    datetime's attributes; strftime re-interprets its format string and
+    consults the locale on every call.
+    """
+    return (
+        f"{parsed_time.year:04d}{parsed_time.month:02d}{parsed_time.day:02d}"
+        f"{parsed_time.hour:02d}{parsed_time.minute:02d}{parsed_time.second:02d}"
+    )
+
 # Azure Table configuration
 TABLE_NAME = "ExceptionTracking"
 
+# Shared partition key, projection and prebuilt filter templates for the
+# dedupe paths - avoids rebuilding f-strings on every query
+_PART_KEY = 'exceptions'
+_SELECT_ROWKEY = ('RowKey',)
+# Existence checks only need the smallest column back on the wire
+_SELECT_EXISTS = ('PartitionKey',)
+_POINT_FILTER = "PartitionKey eq '%s' and RowKey eq '%s'"
+_RANGE_FILTER = "PartitionKey eq '%s' and RowKey ge '%s' and RowKey le '%s'"
+
 # Global table client with connection pooling
 table_client = None
 
+# RowKeys we already know are processed (value is the Jira key). The query
+# window is ago(1h) but triggers fire every few minutes, so steady-state
+# dedupe resolves here without touching Azure at all.
+_processed_cache = TTLCache(maxsize=10_000, ttl=3600)
+
 def get_table_client():
-    """Get or create the table client using managed identity with retry logic"""
+    """
+    Get or create the table client with retry logic.
+
+    The cached client is returned as-is: probing it with a list call on
+    every lookup costs a full HTTP round-trip. Failures surface from the
+    actual table operation instead, and callers recover lazily by calling
+    reset_table_client() and retrying.
+    """
     global table_client
-    
+
+    if table_client is not None:
+        return table_client
+
     for attempt in range(MAX_RETRIES):
         try:
-            if table_client is not None:
-                # Test if the client is still valid - fixed 'take' parameter issue
-                list(table_client.list_entities(select=['PartitionKey']).take(1))
-                return table_client
-
-            # Create new client
-            table_service = TableServiceClient.from_connection_string(AZURE_CONNECTION_STRING)
+            table_service = TableServiceClient.from_connection_string(
+                AZURE_CONNECTION_STRING,
+                transport=_build_table_transport()
+            )
             try:
                 table_service.create_table(TABLE_NAME)
                 logger.info(f"Created new table {TABLE_NAME}")
             except ResourceExistsError:
                 logger.debug(f"Table {TABLE_NAME} already exists")
-            
+
             table_client = table_service.get_table_client(TABLE_NAME)
             return table_client
-            
+
         except Exception as e:
             logger.error(f"Attempt {attempt + 1}/{MAX_RETRIES} failed: {str(e)}")
             if attempt < MAX_RETRIES - 1:
                 time.sleep(RETRY_DELAY)
             table_client = None
-    
+
     raise ConnectionError("Failed to establish table client connection after retries")
 
+def reset_table_client():
+    """Drop the cached table client so the next get_table_client() rebuilds it"""
+    global table_client
+    table_client = None
+
+def ensure_table_exists():
+    """
+    Recover from a vanished table: drop the cached client and rebuild it,
+    which re-runs the create_table dance. Returns the fresh client.
+    """
+    reset_table_client()
+    return get_table_client()
+
+def _warm_processed_cache():
+    """
+    Warm the processed-RowKey cache with the last two hours of entries so
+    the first trigger after a restart doesn't re-query rows we already
+    know about. Best-effort: failures just leave the cache cold.
+    """
+    try:
+        client = get_table_client()
+        since = make_row_key(datetime.utcnow() - timedelta(hours=2))
+        entities = client.query_entities(
+            "PartitionKey eq '%s' and RowKey ge '%s'" % (_PART_KEY, since),
+            select=['RowKey', 'JiraKey']
+        )
+        for entity in entities:
+            _processed_cache[entity['RowKey']] = entity.get('JiraKey', '')
+        logger.info(f"Warmed processed cache with {len(_processed_cache)} entries")
+    except Exception as e:
+        logger.warning(f"Could not warm processed cache: {str(e)}")
+
+_warm_processed_cache()
+
 @app.before_request
 def before_request():
     """Log incoming requests"""
@@ -180,84 +351,174 @@ def is_exception_processed(problem_id, timestamp):
     try:
         client = get_table_client()
         if not client:
-            print("Table client not available - treating as not processed")
+            logger.warning("Table client not available - treating as not processed")
             return False
 
         # Parse the incoming timestamp and create the RowKey
-        current_timestamp = parse(timestamp)
-        row_key = current_timestamp.strftime("%Y%m%d%H%M%S")
+        row_key = make_row_key(fast_parse(timestamp))
         
         try:
-            # Query for exact timestamp match using RowKey
-            filter_query = f"RowKey eq '{row_key}'"
-            entities = client.query_entities(filter_query)
+            # Query for exact timestamp match using RowKey; one result per
+            # page short-circuits server-side pagination on the first hit
+            filter_query = _POINT_FILTER % (_PART_KEY, row_key)
+            entities = client.query_entities(
+                filter_query,
+                select=_SELECT_EXISTS,
+                results_per_page=1
+            )
             
             # If any matching entry exists, it's a duplicate
             if next(entities, None) is not None:
-                print(f"Found existing entry for timestamp {timestamp}")
+                logger.debug("Found existing entry for timestamp %s", timestamp)
                 return True
                 
-            print(f"No existing entry found for timestamp {timestamp}")
+            logger.debug("No existing entry found for timestamp %s", timestamp)
             return False
             
-        except azure.core.exceptions.ResourceNotFoundError:
-            # Table doesn't exist, ensure it's created
-            client = ensure_table_exists()
+        except ResourceNotFoundError:
+            # Table vanished under us - recreate it; nothing can have been
+            # processed if the table is gone
+            ensure_table_exists()
             return False
         except Exception as e:
-            print(f"Error querying table: {str(e)}")
+            logger.error("Error querying table: %s", e)
             return False
             
-    except Exception as e:
-        print(f"Error checking exception status: {str(e)}")
-        traceback.print_exc()
+    except Exception:
+        logger.exception("Error checking exception status")
         return False
 
-def mark_exception_processed(problem_id, timestamp, jira_key):
+def get_processed_row_keys(row_keys):
     """
-    Mark an exception as processed in Azure Table
+    Fetch the already-processed RowKeys for a batch of exceptions in a single
+    range query. All RowKeys are YYYYMMDDHHMMSS strings under the same
+    partition, so one ge/le query covers the whole batch instead of issuing
+    one point query per row.
+
+    Returns a set of RowKeys, or None if the query failed (callers should
+    fall back to per-row checks).
     """
+    if not row_keys:
+        return set()
+
+    # Resolve what we can from the in-process cache and only hit Azure for
+    # the remainder
+    cached = {rk for rk in row_keys if rk in _processed_cache}
+    remaining = [rk for rk in row_keys if rk not in cached]
+    if not remaining:
+        return cached
+
     try:
         client = get_table_client()
         if not client:
-            print("Failed to mark exception as processed - table client not available")
+            logger.warning("Table client not available - falling back to per-row checks")
+            return None
+
+        lo, hi = min(remaining), max(remaining)
+        filter_query = _RANGE_FILTER % (_PART_KEY, lo, hi)
+        entities = client.query_entities(filter_query, select=_SELECT_ROWKEY)
+        fetched = {entity['RowKey'] for entity in entities}
+        for rk in fetched:
+            _processed_cache[rk] = ''
+        return cached | fetched
+
+    except Exception as e:
+        logger.error("Error fetching processed row keys: %s", e)
+        return None
+
+def build_processed_entity(problem_id, timestamp, row_key, jira_key):
+    """Build the Table Storage entity recording a processed exception"""
+    return {
+        'PartitionKey': _PART_KEY,
+        'RowKey': row_key,
+        'JiraKey': jira_key,
+        'ProcessedTime': datetime.utcnow().isoformat(),
+        'OriginalProblemId': problem_id,
+        'OriginalTimestamp': timestamp
+    }
+
+def submit_processed_entities(entities):
+    """
+    Upsert processed-exception entities in transactional batches of 100
+    (the Entity Group Transaction limit per partition). Falls back to
+    individual upserts if a batch is rejected.
+    """
+    if not entities:
+        return
+
+    # A transaction with two operations on the same entity is rejected
+    # outright (InvalidDuplicateRow), so collapse duplicate RowKeys first;
+    # last one wins
+    entities = list({entity['RowKey']: entity for entity in entities}.values())
+
+    try:
+        client = get_table_client()
+    except Exception as e:
+        logger.error("Error submitting processed entities: %s", e)
+        client = None
+
+    if not client:
+        logger.error("Failed to submit processed entities - table client not available")
+        return
+
+    operations = [('upsert', entity) for entity in entities]
+    for i in range(0, len(operations), 100):
+        chunk = operations[i:i + 100]
+        try:
+            client.submit_transaction(chunk)
+            for _, entity in chunk:
+                _processed_cache[entity['RowKey']] = entity['JiraKey']
+        except TableTransactionError as e:
+            logger.warning("Batch upsert failed (%s), falling back to individual upserts", e)
+            for _, entity in chunk:
+                mark_exception_processed(
+                    entity['OriginalProblemId'],
+                    entity['OriginalTimestamp'],
+                    entity['JiraKey'],
+                    row_key=entity['RowKey']
+                )
+        except Exception as e:
+            logger.error("Error submitting batch: %s", e)
+
+def mark_exception_processed(problem_id, timestamp, jira_key, row_key=None):
+    """
+    Mark an exception as processed in Azure Table. Callers that already
+    computed the RowKey pass it in to skip re-parsing the timestamp.
+    """
+    try:
+        client = get_table_client()
+        if not client:
+            logger.error("Failed to mark exception as processed - table client not available")
             return
 
         # Use timestamp as the primary key
-        parsed_time = parse(timestamp)
-        row_key = parsed_time.strftime("%Y%m%d%H%M%S")
-        
-        entity = {
-            'PartitionKey': 'exceptions',
-            'RowKey': row_key,
-            'JiraKey': jira_key,
-            'ProcessedTime': datetime.utcnow().isoformat(),
-            'OriginalProblemId': problem_id,
-            'OriginalTimestamp': timestamp
-        }
-        
+        if row_key is None:
+            row_key = make_row_key(fast_parse(timestamp))
+
+        entity = build_processed_entity(problem_id, timestamp, row_key, jira_key)
+
         max_retries = 3
         retry_count = 0
         
         while retry_count < max_retries:
             try:
                 client.upsert_entity(entity=entity)
-                print(f"Successfully marked exception at {timestamp} as processed")
+                _processed_cache[row_key] = jira_key
+                logger.debug("Successfully marked exception at %s as processed", timestamp)
                 return
-            except azure.core.exceptions.ResourceNotFoundError:
-                # Table doesn't exist, create it and retry
-                print("Table not found, recreating...")
+            except ResourceNotFoundError:
+                # Table doesn't exist, recreate it and retry
+                logger.warning("Table not found, recreating...")
                 client = ensure_table_exists()
                 retry_count += 1
             except Exception as e:
-                print(f"Error upserting entity (attempt {retry_count + 1}): {str(e)}")
+                logger.error("Error upserting entity (attempt %d): %s", retry_count + 1, e)
                 retry_count += 1
                 
-        print("Failed to mark exception as processed after all retries")
+        logger.error("Failed to mark exception as processed after all retries")
         
-    except Exception as e:
-        print(f"Error marking exception as processed: {str(e)}")
-        traceback.print_exc()
+    except Exception:
+        logger.exception("Error marking exception as processed")
 
 def query_app_insights():
     """
@@ -265,70 +526,45 @@ def query_app_insights():
     Returns a list of exceptions with their details.
     """
     try:
-        # Check for required App Insights credentials
-        app_id = os.environ.get('APPINSIGHTS_APP_ID')
-        api_key = os.environ.get('APPINSIGHTS_API_KEY')
-        
-        if not app_id or not api_key:
-            print("ERROR: App Insights credentials not set")
-            return []
-
-        # Query to fetch exceptions with relevant fields
-        query = """
-        exceptions
-        | where timestamp >= ago(1h)
-        | project 
-            timestamp,              // When the exception occurred
-            problemId,             // Unique identifier for the exception
-            type,                  // Exception type (e.g., NullReferenceException)
-            outerMessage,          // The exception message
-            customDimensions       // Additional context (environment, version, etc.)
-        | order by timestamp desc  // Most recent first
-        """
-        
-        # Make API request to App Insights
-        url = f"https://api.applicationinsights.io/v1/apps/{app_id}/query"
-        headers = {
-            "X-Api-Key": api_key,
-            "Content-Type": "application/json"
-        }
-        
-        print("\nQuerying App Insights...")
-        response = requests.post(
-            url,
-            headers=headers,
-            json={"query": query},
-            timeout=30
+        logger.debug("Querying App Insights")
+        response = APPINSIGHTS_SESSION.post(
+            APPINSIGHTS_URL,
+            headers=APPINSIGHTS_HEADERS,
+            json={"query": APPINSIGHTS_QUERY},
+            timeout=REQUEST_TIMEOUT
         )
         
         if response.status_code != 200:
-            print(f"API Error: {response.text}")
+            logger.error("App Insights API error: %s", response.text)
             return []
             
-        # Process the response
-        data = response.json()
+        # Process the response; orjson is considerably faster than
+        # response.json() on large result sets
+        data = orjson.loads(response.content)
         if 'tables' not in data or not data['tables']:
             return []
-            
-        # Transform the data into a more usable format
+
+        # Resolve column positions once, then unpack rows positionally
+        # instead of building a dict per row
         table = data['tables'][0]
-        columns = [col['name'] for col in table['columns']]
-        formatted_rows = []
-        
-        for row in table['rows']:
-            row_dict = dict(zip(columns, row))
-            formatted_row = [
-                row_dict['timestamp'],
-                row_dict['problemId'],
+        idx = {col['name']: i for i, col in enumerate(table['columns'])}
+        ts_i, pid_i = idx['timestamp'], idx['problemId']
+        type_i, msg_i, dims_i = idx['type'], idx['outerMessage'], idx['customDimensions']
+
+        formatted_rows = [
+            [
+                row[ts_i],
+                row[pid_i],
                 {
-                    'type': row_dict['type'],
-                    'message': row_dict['outerMessage'],
-                    'customDimensions': row_dict['customDimensions']
+                    'type': row[type_i],
+                    'message': row[msg_i],
+                    'customDimensions': row[dims_i]
                 }
             ]
-            formatted_rows.append(formatted_row)
-        
-        print(f"Found {len(formatted_rows)} exceptions")
+            for row in table['rows']
+        ]
+
+        logger.debug("Found %d exceptions", len(formatted_rows))
         return formatted_rows
         
     except Exception as e:
@@ -359,19 +595,18 @@ def create_jira_issue(summary, description, issue_type="Bug"):
     }
     
     try:
-        response = requests.post(
+        response = JIRA_SESSION.post(
             url,
             json=payload,
-            auth=HTTPBasicAuth(JIRA_EMAIL, JIRA_TOKEN),
-            headers={"Content-Type": "application/json"}
+            timeout=REQUEST_TIMEOUT
         )
         
         response.raise_for_status()
         return response.json()
     except requests.exceptions.RequestException as e:
-        print(f"Error creating Jira ticket: {str(e)}")
+        logger.error("Error creating Jira ticket: %s", e)
         if hasattr(e.response, 'text'):
-            print(f"Jira API Response: {e.response.text}")
+            logger.error("Jira API response: %s", e.response.text)
         raise
 
 @app.route('/appget', methods=['GET'])
@@ -380,7 +615,7 @@ def get_app_insights_data():
     Endpoint to fetch exception data from App Insights.
     Returns a JSON response with exception details.
     """
-    print("\n=== Starting /appget request ===")
+    logger.debug("Starting /appget request")
     
     try:
         exceptions = query_app_insights()
@@ -401,8 +636,7 @@ def get_app_insights_data():
         return jsonify(response_data)
         
     except Exception as e:
-        print(f"Error in endpoint: {str(e)}")
-        traceback.print_exc()
+        logger.exception("Error in /appget endpoint")
         return jsonify({
             "error": str(e),
             "count": 0,
@@ -417,11 +651,11 @@ def manual_trigger():
     No authentication or payload required.
     """
     try:
-        print("\n=== Starting trigger ===")
+        logger.debug("Starting trigger")
         
         # Fetch exceptions from App Insights
         exceptions = query_app_insights()
-        print(f"Number of exceptions returned: {len(exceptions)}")
+        logger.debug("Number of exceptions returned: %d", len(exceptions))
         
         if not exceptions:
             return jsonify({
@@ -435,51 +669,78 @@ def manual_trigger():
         
         created = 0
         skipped = 0
-        
-        # Process each exception and create Jira tickets
-        for row in exceptions:
-            try:
-                timestamp = row[0]
-                problem_id = row[1]
-                details = row[2]
-                
-                # Skip if already processed
-                if is_exception_processed(problem_id, timestamp):
-                    print(f"Skipping already processed exception {problem_id}")
-                    skipped += 1
-                    continue
-                
-                # Create Jira ticket
-                description = f"""Exception Details:
------------------
-Problem ID: {problem_id}
-Timestamp: {timestamp}
-Type: {details['type']}
-
-Message:
-{details['message']}
-
-Custom Dimensions:
-{json.dumps(details['customDimensions'], indent=2)}
-
-*Created by automatic exception tracking*"""
+        pending_entities = []
+
+        # Dedupe the whole batch with one range query; the per-row point
+        # query is only used if the batch query fails
+        row_keys = [make_row_key(fast_parse(row[0])) for row in exceptions]
+        processed = get_processed_row_keys(row_keys)
+
+        # Filter out already-processed rows before fanning out. RowKeys are
+        # second-granularity, so a burst can map several rows to the same
+        # key; track keys claimed within this batch so only the first row
+        # per second creates a ticket
+        fresh_rows = []
+        seen_in_batch = set()
+        for row, row_key in zip(exceptions, row_keys):
+            if row_key in seen_in_batch:
+                already_processed = True
+            elif processed is not None:
+                already_processed = row_key in processed
+            else:
+                already_processed = is_exception_processed(row[1], row[0])
+
+            if already_processed:
+                logger.debug("Skipping already processed exception %s", row[1])
+                skipped += 1
+            else:
+                seen_in_batch.add(row_key)
+                fresh_rows.append((row, row_key))
+
+        # Jira creates are independent and IO-bound, so overlap them with a
+        # worker pool sharing the pooled session instead of paying one
+        # round-trip at a time
+        with ThreadPoolExecutor(max_workers=JIRA_WORKERS) as executor:
+            futures = {}
+            for (timestamp, problem_id, details), row_key in fresh_rows:
+                description = _DESC_TMPL.format(
+                    problem_id=problem_id,
+                    timestamp=timestamp,
+                    type=details['type'],
+                    message=details['message'],
+                    custom_dimensions=orjson.dumps(
+                        details['customDimensions'],
+                        option=orjson.OPT_INDENT_2
+                    ).decode()
+                )
 
                 summary = f"Exception {problem_id} at {timestamp}"
-                
-                # Create the Jira ticket
-                jira_response = create_jira_issue(
+
+                future = executor.submit(
+                    create_jira_issue,
                     summary=summary,
                     description=description
                 )
-                
+                futures[future] = (problem_id, timestamp, row_key)
+
+            for future in as_completed(futures):
+                problem_id, timestamp, row_key = futures[future]
+                try:
+                    jira_response = future.result()
+                except Exception as e:
+                    logger.error("Error processing exception: %s", e)
+                    continue
+
                 if jira_response and 'key' in jira_response:
-                    mark_exception_processed(problem_id, timestamp, jira_response['key'])
+                    pending_entities.append(
+                        build_processed_entity(problem_id, timestamp, row_key, jira_response['key'])
+                    )
                     created += 1
-                    print(f"Created Jira ticket {jira_response['key']} for {problem_id}")
-                    
-            except Exception as e:
-                print(f"Error processing exception: {str(e)}")
-                continue
+                    logger.info("Created Jira ticket %s for %s", jira_response['key'], problem_id)
+
+        # Record everything we created in batched transactions rather than
+        # one upsert round-trip per ticket
+        submit_processed_entities(pending_entities)
 
         return jsonify({
             "status": "completed",
@@ -491,15 +752,14 @@ Custom Dimensions:
         })
         
     except Exception as e:
-        print(f"Error in trigger: {str(e)}")
-        traceback.print_exc()
+        logger.exception("Error in trigger")
         return jsonify({
             "status": "error",
             "error": str(e)
         }), 500
 
 if __name__ == '__main__':
-    # Production server configuration
-    from waitress import serve
+    # Development entry point only; production runs under gunicorn's gevent
+    # workers (see Dockerfile)
     port = int(os.environ.get('PORT', 5000))
-    serve(app, host='0.0.0.0', port=port, threads=4)
+    app.run(host='0.0.0.0', port=port)
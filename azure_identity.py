@@ -1,7 +1,12 @@
 import logging
+import time
+from functools import lru_cache
 from azure.identity import DefaultAzureCredential, ManagedIdentityCredential
 import os
 
+# Refresh cached tokens this many seconds before they actually expire
+TOKEN_REFRESH_MARGIN = 300
+
 class AzureIdentityManager:
     """Manages Azure authentication using user-assigned or system-assigned managed identities."""
     
@@ -21,19 +26,35 @@ class AzureIdentityManager:
                 exclude_cli_credential=True
             )
 
+        # scope -> (token string, expires_on epoch seconds)
+        self._token_cache = {}
+
     def get_token(self, scope: str) -> str:
         """
         Get an authentication token for the specified scope.
-        
+
+        Tokens are cached per scope until shortly before expiry, so
+        repeated calls don't round-trip to IMDS.
+
         Args:
             scope: The scope for which to request the token
-            
+
         Returns:
             The authentication token
         """
+        cached = self._token_cache.get(scope)
+        if cached and time.time() < cached[1] - TOKEN_REFRESH_MARGIN:
+            return cached[0]
+
         try:
             token = self.credential.get_token(scope)
+            self._token_cache[scope] = (token.token, token.expires_on)
             return token.token
         except Exception as e:
             logging.error(f"Failed to get token for scope {scope}: {str(e)}")
-            raise
\ No newline at end of file
+            raise
+
+@lru_cache(maxsize=None)
+def get_identity_manager() -> AzureIdentityManager:
+    """Process-wide AzureIdentityManager so every caller shares one credential."""
+    return AzureIdentityManager()
\ No newline at end of file
@@ -1,11 +1,12 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict
 from azure.keyvault.secrets import SecretClient
 from azure.core.exceptions import ResourceNotFoundError, HttpResponseError
 import os
 import time
 from random import uniform
-from azure_identity import AzureIdentityManager  # Changed from relative to absolute import
+from azure_identity import get_identity_manager  # Changed from relative to absolute import
 
 class AzureKeyVaultClient:
     """Client for fetching secrets from Azure Key Vault using managed identity."""
@@ -29,21 +30,15 @@ class AzureKeyVaultClient:
         try:
             self.vault_url = f"https://{vault_name}.vault.azure.net/"
             
-            # Initialize identity manager
-            identity_manager = AzureIdentityManager()
+            # Use the shared identity manager so credentials (and their
+            # token caches) are reused process-wide
+            identity_manager = get_identity_manager()
             self.credential = identity_manager.credential
 
-            # Create and test the secret client
+            # Create the secret client; no probe request here - the first
+            # get_secret call will surface auth/connectivity errors
             self.secret_client = SecretClient(vault_url=self.vault_url, credential=self.credential)
-            logging.info(f"Attempting to access Key Vault: {self.vault_url}")
-
-            # Test the credential with a simple operation
-            try:
-                next(self.secret_client.list_properties_of_secrets(max_page_size=1), None)
-                logging.info(f"Successfully connected to Key Vault: {self.vault_url}")
-            except Exception as access_error:
-                logging.error(f"Access test failed: {str(access_error)}")
-                raise
+            logging.info(f"Using Key Vault: {self.vault_url}")
 
         except Exception as e:
             logging.error(f"Failed to initialize Key Vault client: {str(e)}")
@@ -60,29 +55,32 @@ class AzureKeyVaultClient:
 
         Returns:
             The secret value
+
+        Raises:
+            HttpResponseError: on non-retryable errors or once retries are
+                exhausted; this function never returns None
         """
         for attempt in range(max_retries):
             try:
                 secret = self.secret_client.get_secret(secret_name)
                 return secret.value
             except HttpResponseError as e:
-                if e.status_code == 429:  # Too Many Requests
-                    if attempt == max_retries - 1:
-                        raise
-
-                    # Calculate backoff with jitter
-                    backoff = initial_backoff * (2 ** attempt)
-                    jitter = uniform(0, 0.1 * backoff)
-                    sleep_time = backoff + jitter
-
-                    logging.warning(
-                        f"Rate limit hit when fetching secret '{secret_name}'. "
-                        f"Retrying in {sleep_time:.2f} seconds (attempt {attempt + 1}/{max_retries})"
-                    )
-                    time.sleep(sleep_time)
-                else:
+                # Only throttling (429) and transient unavailability (503)
+                # are worth retrying
+                if e.status_code not in (429, 503) or attempt == max_retries - 1:
                     raise
 
+                # Full jitter: sleep anywhere in [0, backoff] so retries
+                # from concurrent fetches don't synchronize
+                sleep_time = uniform(0, initial_backoff * (2 ** attempt))
+                logging.warning(
+                    f"Retryable error ({e.status_code}) fetching secret '{secret_name}'. "
+                    f"Retrying in {sleep_time:.2f} seconds (attempt {attempt + 1}/{max_retries})"
+                )
+                time.sleep(sleep_time)
+
+        raise RuntimeError(f"Retry loop for secret '{secret_name}' exited unexpectedly")
+
     def get_required_secrets(self) -> Dict[str, str]:
         """
         First check environment variables for required secrets,
@@ -105,21 +103,30 @@ class AzureKeyVaultClient:
             else:
                 secrets_to_fetch.append(secret_name)
 
-        # Only fetch from Key Vault if there are missing secrets
+        # Only fetch from Key Vault if there are missing secrets. Each fetch
+        # is an independent HTTPS call, so fan them out and let cold-start
+        # latency be bounded by the slowest secret instead of the sum.
         if secrets_to_fetch:
             logging.info(f"Fetching {len(secrets_to_fetch)} missing secrets from Key Vault")
-            for secret_name in secrets_to_fetch:
-                try:
-                    secret_value = self._get_secret_with_retry(secret_name)
-                    env_name = secret_name.replace("-", "_")
-                    secrets[env_name] = secret_value
-                    logging.info(f"Successfully retrieved secret from Key Vault: {secret_name}")
-                except ResourceNotFoundError:
-                    missing_secrets.append(secret_name)
-                    logging.error(f"Secret not found in Key Vault: {secret_name}")
-                except Exception as e:
-                    missing_secrets.append(secret_name)
-                    logging.error(f"Error retrieving secret '{secret_name}': {str(e)}")
+            max_workers = min(len(self.REQUIRED_SECRETS), len(secrets_to_fetch))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(self._get_secret_with_retry, secret_name): secret_name
+                    for secret_name in secrets_to_fetch
+                }
+                for future in as_completed(futures):
+                    secret_name = futures[future]
+                    try:
+                        secret_value = future.result()
+                        env_name = secret_name.replace("-", "_")
+                        secrets[env_name] = secret_value
+                        logging.info(f"Successfully retrieved secret from Key Vault: {secret_name}")
+                    except ResourceNotFoundError:
+                        missing_secrets.append(secret_name)
+                        logging.error(f"Secret not found in Key Vault: {secret_name}")
+                    except Exception as e:
+                        missing_secrets.append(secret_name)
+                        logging.error(f"Error retrieving secret '{secret_name}': {str(e)}")
 
         if missing_secrets:
             raise ValueError(f"Missing required secrets: {', '.join(missing_secrets)}")